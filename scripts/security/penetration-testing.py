@@ -4,20 +4,263 @@ Automated Penetration Testing Script
 Performs basic security testing against the task management application
 """
 
-import requests
-import json
+import ahocorasick
+import aiohttp
+import asyncio
+import codecs
+import contextvars
+import diskcache
+import functools
+import hashlib
+import html
+import orjson
+import os
+import re
 import time
 import random
 import string
 import sys
+from collections import Counter
+from multidict import CIMultiDict
 from urllib.parse import urljoin
 from datetime import datetime
 import argparse
 
+try:
+    import uvloop
+except ImportError:  # optional, e.g. not available on Windows
+    uvloop = None
+
+try:
+    import hyperscan
+except ImportError:  # optional, indicator matching falls back to Aho-Corasick
+    hyperscan = None
+
+try:
+    import brotli  # noqa: F401 - enables aiohttp's Brotli decoding
+    ACCEPT_ENCODING = 'gzip, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip'
+
+# Application endpoints exercised by the tests
+API_ENDPOINTS = (
+    '/api/auth/login',
+    '/api/tasks',
+    '/api/projects',
+    '/api/users/profile'
+)
+
+# Admin endpoints that must not be reachable without authorization
+ADMIN_ENDPOINTS = (
+    '/api/admin/users',
+    '/api/admin/system/health',
+    '/api/admin/analytics',
+    '/api/admin/settings'
+)
+
+# Endpoints that commonly expose sensitive information
+SENSITIVE_ENDPOINTS = (
+    '/.env',
+    '/config.json',
+    '/package.json',
+    '/api/debug',
+    '/api/health',
+    '/swagger.json',
+    '/api-docs'
+)
+
+# Security headers every response should carry
+REQUIRED_SECURITY_HEADERS = (
+    'X-Content-Type-Options',
+    'X-Frame-Options',
+    'X-XSS-Protection',
+    'Strict-Transport-Security',
+    'Content-Security-Policy',
+    'Referrer-Policy'
+)
+
+# Accepted values for the security headers whose value is checked
+EXPECTED_HEADER_VALUES = {
+    'X-Content-Type-Options': frozenset({'nosniff'}),
+    'X-Frame-Options': frozenset({'DENY', 'SAMEORIGIN'}),
+    'X-XSS-Protection': frozenset({'1; mode=block'})
+}
+
+# Request bodies are pre-serialized with orjson and sent as raw bytes
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Scanned pages (e.g. swagger.json) compress well; aiohttp decodes them in C
+COMPRESSED_HEADERS = {'Accept-Encoding': ACCEPT_ENCODING}
+
+# Connection pool size; covers the largest concurrent fan-out of any test so
+# probes never wait on a free connection
+CONNECTION_POOL_SIZE = 64
+
+# Upper bound on in-flight endpoint scans so the target is not overwhelmed
+MAX_CONCURRENT_PROBES = 20
+
+# Read size used when streaming response bodies through the indicator matchers
+SCAN_CHUNK_SIZE = 4096
+
+# On-disk cache of probe results so repeated runs skip unchanged network I/O
+RESPONSE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pentest')
+RESPONSE_CACHE_TTL = 300
+
+# Seconds a login token is reused before authenticate() logs in again
+AUTH_TOKEN_TTL = 60
+
+# Report page; results_html is pre-rendered and all values are HTML-escaped
+HTML_REPORT_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Penetration Testing Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; }
+        .summary { margin: 20px 0; }
+        .result { margin: 10px 0; padding: 10px; border-radius: 5px; }
+        .critical { background-color: #ffebee; border-left: 5px solid #f44336; }
+        .high { background-color: #fff3e0; border-left: 5px solid #ff9800; }
+        .medium { background-color: #f3e5f5; border-left: 5px solid #9c27b0; }
+        .low { background-color: #e8f5e8; border-left: 5px solid #4caf50; }
+        .info { background-color: #e3f2fd; border-left: 5px solid #2196f3; }
+        .vulnerable { background-color: #ffcdd2; }
+        .secure { background-color: #c8e6c9; }
+        .error { background-color: #ffecb3; }
+        .timestamp { font-size: 0.8em; color: #666; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Penetration Testing Report</h1>
+        <p><strong>Target:</strong> $target</p>
+        <p><strong>Generated:</strong> $timestamp</p>
+    </div>
+    
+    <div class="summary">
+        <h2>Summary</h2>
+        <p><strong>Total Tests:</strong> $total_tests</p>
+        <p><strong>Critical Issues:</strong> $critical_count</p>
+        <p><strong>High Issues:</strong> $high_count</p>
+        <p><strong>Medium Issues:</strong> $medium_count</p>
+        <p><strong>Low Issues:</strong> $low_count</p>
+    </div>
+    
+    <div class="results">
+        <h2>Detailed Results</h2>
+        $results_html
+    </div>
+</body>
+</html>
+""")
+
+# Output lines of the currently running test, written out in one go when it ends
+_log_buffer = contextvars.ContextVar('log_buffer', default=None)
+
+# Response indicators of SQL errors and leaked sensitive data (lowercase)
+SQL_ERROR_INDICATORS = (
+    'sql syntax',
+    'mysql_fetch',
+    'postgresql',
+    'ora-',
+    'microsoft jet database',
+    'sqlite_',
+    'syntax error'
+)
+
+SENSITIVE_PATTERNS = (
+    'password',
+    'secret',
+    'key',
+    'token',
+    'database',
+    'connection'
+)
+
+INDICATOR_SETS = (SQL_ERROR_INDICATORS, SENSITIVE_PATTERNS)
+
+def describe_error(error):
+    """Format an exception for a result row; aiohttp timeouts have an empty str()"""
+    message = str(error)
+    return f'{type(error).__name__}: {message}' if message else type(error).__name__
+
+def build_automaton(words):
+    """Build an Aho-Corasick automaton matching any of the given words"""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+def build_hyperscan_database(words):
+    """Compile words into one caseless streaming Hyperscan database
+    
+    Each word's expression id is its index in words.
+    """
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_STREAM)
+    database.compile(
+        expressions=[re.escape(word).encode() for word in words],
+        ids=list(range(len(words))),
+        elements=len(words),
+        flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    return database
+
+# All indicator sets share one Hyperscan database; HYPERSCAN_IDS maps each set
+# to the expression ids of its words
+HYPERSCAN_WORDS = SQL_ERROR_INDICATORS + SENSITIVE_PATTERNS
+HYPERSCAN_IDS = {
+    SQL_ERROR_INDICATORS: range(0, len(SQL_ERROR_INDICATORS)),
+    SENSITIVE_PATTERNS: range(len(SQL_ERROR_INDICATORS), len(HYPERSCAN_WORDS))
+}
+HYPERSCAN_DATABASE = None
+if hyperscan is not None:
+    try:
+        HYPERSCAN_DATABASE = build_hyperscan_database(HYPERSCAN_WORDS)
+    except hyperscan.HyperscanError:  # e.g. CPU lacks the required SIMD support
+        pass
+
+# Cached probe results are only valid for the rules that produced them. The key
+# namespace covers the indicator words, the matching backend and a schema number
+# to bump whenever the classification or the shape of cached results changes.
+RESPONSE_CACHE_SCHEMA = 2
+RESPONSE_CACHE_NAMESPACE = hashlib.blake2b(repr((
+    RESPONSE_CACHE_SCHEMA,
+    HYPERSCAN_WORDS,
+    'hyperscan' if HYPERSCAN_DATABASE is not None else 'ahocorasick'
+)).encode()).digest()
+
 class PenetrationTester:
-    def __init__(self, base_url, output_file='penetration-test-report.html'):
+    # Oversized field value used by the input validation test
+    LARGE_INPUT = 'A' * 10000
+
+    # CSS classes for each (severity, status) pair a result row can have
+    RESULT_CSS_CLASSES = {
+        (severity, status): f"{severity} {status}"
+        for severity in ('critical', 'high', 'medium', 'low', 'info')
+        for status in ('vulnerable', 'secure', 'error', 'skipped', 'info')
+    }
+
+    def __init__(self, base_url, output_file='penetration-test-report.html', use_cache=True):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        self.cache = None
+        self.cache_hits = 0
+        if use_cache:
+            # Cached probe results describe the target; keep them private to the user
+            os.makedirs(RESPONSE_CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(RESPONSE_CACHE_DIR, 0o700)
+            self.cache = diskcache.Cache(RESPONSE_CACHE_DIR)
+        # Absolute URL of every endpoint, resolved once up front
+        self._urls = {
+            endpoint: urljoin(self.base_url, endpoint)
+            for endpoint in API_ENDPOINTS + ADMIN_ENDPOINTS + SENSITIVE_ENDPOINTS
+        }
+        self.session = None
+        self._token = None
+        self._token_time = 0
+        self._auth_lock = asyncio.Lock()
+        self._probe_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
         self.results = []
         self.output_file = output_file
         
@@ -45,6 +288,34 @@ class PenetrationTester:
             "; cat /etc/shadow",
             "| id"
         ]
+        
+        # Ready-to-send request bodies for each payload, serialized once
+        self._sql_login_bodies = [
+            orjson.dumps({'email': f"admin{payload}", 'password': 'password'})
+            for payload in self.sql_payloads
+        ]
+        
+        self._xss_task_bodies = [
+            orjson.dumps({
+                'title': f'Test Task {payload}',
+                'description': f'Description with XSS: {payload}',
+                'projectId': '123'
+            })
+            for payload in self.xss_payloads
+        ]
+        
+        # Oversized request bodies, serialized once per shape
+        self._large_input_bodies = [
+            ('/api/tasks', orjson.dumps({'title': self.LARGE_INPUT, 'description': 'test'})),
+            ('/api/projects', orjson.dumps({'name': self.LARGE_INPUT, 'description': 'test'})),
+            ('/api/users/profile', orjson.dumps({'firstName': self.LARGE_INPUT, 'lastName': 'test'}))
+        ]
+        
+        # Match all indicators in a single pass over each response
+        if HYPERSCAN_DATABASE is not None:
+            self._hyperscan_scratch = hyperscan.Scratch(HYPERSCAN_DATABASE)
+        else:
+            self._automata = {indicators: build_automaton(indicators) for indicators in INDICATOR_SETS}
 
     def log_result(self, test_name, status, details, severity='medium'):
         """Log test result"""
@@ -56,63 +327,223 @@ class PenetrationTester:
             'details': details
         }
         self.results.append(result)
-        print(f"[{status.upper()}] {test_name}: {details}")
+        self._log(f"[{status.upper()}] {test_name}: {details}")
+
+    def _log(self, message):
+        """Write a line of progress output, batched per running test"""
+        buffer = _log_buffer.get()
+        if buffer is None:
+            sys.stderr.write(message + '\n')
+        else:
+            buffer.append(message + '\n')
+
+    async def _fetch(self, method, url, **kwargs):
+        """Perform a request on the shared session and return (status, body)"""
+        async with self.session.request(method, url, **kwargs) as response:
+            return response.status, await response.text()
+
+    @staticmethod
+    async def _iter_text(response):
+        """Yield the response body as decoded text chunks"""
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        async for chunk in response.content.iter_chunked(SCAN_CHUNK_SIZE):
+            yield decoder.decode(chunk)
+        yield decoder.decode(b'', final=True)
+
+    async def _scan(self, method, url, indicators, keep_body=False, **kwargs):
+        """Stream a response through an indicator matcher, stopping at the first match
+        
+        Returns (status, matched indicator or None, body). The body is only
+        buffered when keep_body is set and no indicator matched.
+        """
+        async with self.session.request(method, url, **kwargs) as response:
+            if HYPERSCAN_DATABASE is not None:
+                word, body = await self._scan_hyperscan(response, indicators, keep_body)
+            else:
+                word, body = await self._scan_automaton(response, indicators, keep_body)
+            
+            if word:
+                # Drop the connection rather than reading the rest of the body
+                response.close()
+            return response.status, word, body
+
+    async def _scan_hyperscan(self, response, indicators, keep_body):
+        """Match raw body bytes against the shared caseless Hyperscan database"""
+        ids = HYPERSCAN_IDS[indicators]
+        matches = []
+        
+        def on_match(match_id, start, end, flags, context):
+            # The database holds every indicator set; only stop on this one
+            if match_id in ids:
+                matches.append(HYPERSCAN_WORDS[match_id])
+                return True
+            return False
+        
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        parts = []
+        
+        # Stream mode carries match state across chunk boundaries
+        with HYPERSCAN_DATABASE.stream(match_event_handler=on_match) as stream:
+            async for chunk in response.content.iter_chunked(SCAN_CHUNK_SIZE):
+                if keep_body:
+                    parts.append(decoder.decode(chunk))
+                try:
+                    stream.scan(chunk, scratch=self._hyperscan_scratch)
+                except hyperscan.ScanTerminated:
+                    return matches[0], None
+        
+        if keep_body:
+            parts.append(decoder.decode(b'', final=True))
+            return None, ''.join(parts)
+        return None, None
+
+    async def _scan_automaton(self, response, indicators, keep_body):
+        """Match the lowercased body text against an Aho-Corasick automaton"""
+        automaton = self._automata[indicators]
+        # Carry the end of each chunk over so matches across chunk boundaries are found
+        overlap = max(map(len, indicators)) - 1
+        parts = []
+        tail = ''
+        
+        async for text in self._iter_text(response):
+            if keep_body:
+                parts.append(text)
+            
+            window = tail + text.lower()
+            for _, word in automaton.iter(window):
+                return word, None
+            tail = window[-overlap:] if overlap else ''
+        
+        return None, ''.join(parts) if keep_body else None
+
+    async def _fetch_headers(self, url):
+        """Return the status and response headers of a URL, as a picklable mapping"""
+        async with self.session.get(url, headers=COMPRESSED_HEADERS) as response:
+            return response.status, CIMultiDict(response.headers)
+
+    async def _fetch_status(self, url):
+        """Return the status code of a URL without downloading its body"""
+        async with self.session.head(url, allow_redirects=False) as response:
+            if response.status not in (405, 501):
+                return response.status
+        
+        # HEAD not supported; ask for the first byte only
+        async with self.session.get(url, allow_redirects=False, headers={'Range': 'bytes=0-0'}) as response:
+            # Don't read on if the server ignored the range
+            response.close()
+            # 206 is a partial body and 416 an empty one; both mean the endpoint answered
+            return 200 if response.status in (206, 416) else response.status
+
+    async def _cached(self, method, url, body, request):
+        """Return the cached result of a probe, or await request() and cache it
+        
+        Results are keyed by method, URL and request body within
+        RESPONSE_CACHE_NAMESPACE, and only cached for side-effect free probes
+        whose outcome is the same across runs. The method is a cache tag and may
+        name a probe kind rather than an HTTP verb, so probes of one URL that
+        keep different results do not collide.
+        """
+        if self.cache is None:
+            return await request()
+        
+        key = hashlib.blake2b(b'\0'.join((
+            RESPONSE_CACHE_NAMESPACE, method.encode(), url.encode(), body or b''
+        ))).digest()
+        # diskcache does blocking SQLite I/O; keep it off the event loop so
+        # concurrent probes are not serialized behind it
+        result = await asyncio.to_thread(self.cache.get, key)
+        if result is not None:
+            self.cache_hits += 1
+        else:
+            result = await request()
+            # Results are a status code or a tuple led by one. Server errors are
+            # often transient (e.g. a target still starting up), so re-probe them
+            status = result if isinstance(result, int) else result[0]
+            if status < 500:
+                await asyncio.to_thread(self.cache.set, key, result, expire=RESPONSE_CACHE_TTL)
+        return result
 
-    def test_sql_injection(self):
+    async def _probe_login(self, url, body):
+        """Send one SQL injection login payload and reduce the response to a verdict
+        
+        Returns (status, SQL error indicator or None, whether a token came back).
+        The response body is never returned, so any issued token stays out of the cache.
+        """
+        status, indicator, text = await self._scan(
+            'POST', url, SQL_ERROR_INDICATORS, keep_body=True, data=body, headers=JSON_HEADERS
+        )
+        return status, indicator, status == 200 and text is not None and 'token' in text
+
+    async def _probe(self, endpoint, indicators=None):
+        """Probe an endpoint, bounded by the scanner concurrency limit
+        
+        Without indicators only the status code is fetched. Otherwise the body
+        is scanned as it streams in and (status, match, body) is returned.
+        """
+        url = self._urls[endpoint]
+        async with self._probe_semaphore:
+            if indicators is None:
+                return await self._cached('HEAD', url, None, functools.partial(self._fetch_status, url))
+            return await self._cached('GET', url, None, functools.partial(
+                self._scan, 'GET', url, indicators, headers=COMPRESSED_HEADERS
+            ))
+
+    async def _probe_group(self, endpoints, indicators=None):
+        """Probe a group of endpoints together over the pooled connections
+        
+        Returns (endpoint, response) pairs in input order; failed probes carry
+        the raised exception in place of the response.
+        """
+        responses = await asyncio.gather(
+            *(self._probe(endpoint, indicators) for endpoint in endpoints),
+            return_exceptions=True
+        )
+        return list(zip(endpoints, responses))
+
+    async def test_sql_injection(self):
         """Test for SQL injection vulnerabilities"""
-        print("\n=== Testing SQL Injection ===")
+        self._log("\n=== Testing SQL Injection ===")
         
         # Test login endpoint
-        login_url = urljoin(self.base_url, '/api/auth/login')
+        login_url = self._urls['/api/auth/login']
         
-        for payload in self.sql_payloads:
-            try:
-                data = {
-                    'email': f"admin{payload}",
-                    'password': 'password'
-                }
-                
-                response = self.session.post(login_url, json=data, timeout=10)
-                
-                # Check for SQL error messages
-                error_indicators = [
-                    'sql syntax',
-                    'mysql_fetch',
-                    'postgresql',
-                    'ora-',
-                    'microsoft jet database',
-                    'sqlite_',
-                    'syntax error'
-                ]
-                
-                response_text = response.text.lower()
-                for indicator in error_indicators:
-                    if indicator in response_text:
-                        self.log_result(
-                            'SQL Injection - Login',
-                            'VULNERABLE',
-                            f'SQL error detected with payload: {payload}',
-                            'critical'
-                        )
-                        return
-                
-                # Check for successful bypass (status 200 with token)
-                if response.status_code == 200 and 'token' in response.text:
-                    self.log_result(
-                        'SQL Injection - Authentication Bypass',
-                        'VULNERABLE',
-                        f'Authentication bypassed with payload: {payload}',
-                        'critical'
-                    )
-                    return
-                    
-            except Exception as e:
+        # Fire all payloads concurrently, then classify in payload order
+        responses = await asyncio.gather(
+            *(self._cached('POST', login_url, body, functools.partial(self._probe_login, login_url, body))
+              for body in self._sql_login_bodies),
+            return_exceptions=True
+        )
+        
+        for payload, response in zip(self.sql_payloads, responses):
+            if isinstance(response, Exception):
                 self.log_result(
                     'SQL Injection Test Error',
                     'ERROR',
-                    f'Error testing payload {payload}: {str(e)}',
+                    f'Error testing payload {payload}: {describe_error(response)}',
                     'low'
                 )
+                continue
+            
+            # Check for SQL error messages
+            status_code, indicator, token_returned = response
+            if indicator:
+                self.log_result(
+                    'SQL Injection - Login',
+                    'VULNERABLE',
+                    f'SQL error detected with payload: {payload}',
+                    'critical'
+                )
+                return
+            
+            # Check for successful bypass (status 200 with token)
+            if token_returned:
+                self.log_result(
+                    'SQL Injection - Authentication Bypass',
+                    'VULNERABLE',
+                    f'Authentication bypassed with payload: {payload}',
+                    'critical'
+                )
+                return
         
         self.log_result(
             'SQL Injection - Login',
@@ -121,12 +552,12 @@ class PenetrationTester:
             'info'
         )
 
-    def test_xss_vulnerabilities(self):
+    async def test_xss_vulnerabilities(self):
         """Test for Cross-Site Scripting vulnerabilities"""
-        print("\n=== Testing XSS Vulnerabilities ===")
+        self._log("\n=== Testing XSS Vulnerabilities ===")
         
         # First, try to authenticate
-        auth_token = self.authenticate()
+        auth_token = await self.authenticate()
         if not auth_token:
             self.log_result(
                 'XSS Testing',
@@ -137,36 +568,37 @@ class PenetrationTester:
             return
         
         # Test task creation endpoint
-        create_task_url = urljoin(self.base_url, '/api/tasks')
-        headers = {'Authorization': f'Bearer {auth_token}'}
+        create_task_url = self._urls['/api/tasks']
+        headers = {**JSON_HEADERS, 'Authorization': f'Bearer {auth_token}'}
         
-        for payload in self.xss_payloads:
-            try:
-                data = {
-                    'title': f'Test Task {payload}',
-                    'description': f'Description with XSS: {payload}',
-                    'projectId': '123'
-                }
-                
-                response = self.session.post(create_task_url, json=data, headers=headers, timeout=10)
-                
-                # Check if payload is reflected without encoding
-                if payload in response.text and response.status_code in [200, 201]:
-                    self.log_result(
-                        'XSS - Task Creation',
-                        'VULNERABLE',
-                        f'XSS payload reflected: {payload}',
-                        'high'
-                    )
-                    return
-                    
-            except Exception as e:
+        responses = await asyncio.gather(
+            *(self._fetch('POST', create_task_url, data=body, headers=headers)
+              for body in self._xss_task_bodies),
+            return_exceptions=True
+        )
+        
+        for payload, response in zip(self.xss_payloads, responses):
+            if isinstance(response, Exception):
                 self.log_result(
                     'XSS Test Error',
                     'ERROR',
-                    f'Error testing XSS payload {payload}: {str(e)}',
+                    f'Error testing XSS payload {payload}: {describe_error(response)}',
                     'low'
                 )
+                continue
+            
+            # Check if payload is reflected without encoding
+            status_code, body = response
+            if status_code == 401:
+                self.invalidate_token()
+            if payload in body and status_code in [200, 201]:
+                self.log_result(
+                    'XSS - Task Creation',
+                    'VULNERABLE',
+                    f'XSS payload reflected: {payload}',
+                    'high'
+                )
+                return
         
         self.log_result(
             'XSS - Task Creation',
@@ -175,14 +607,14 @@ class PenetrationTester:
             'info'
         )
 
-    def test_authentication_security(self):
+    async def test_authentication_security(self):
         """Test authentication security measures"""
-        print("\n=== Testing Authentication Security ===")
+        self._log("\n=== Testing Authentication Security ===")
         
         # Test brute force protection
-        login_url = urljoin(self.base_url, '/api/auth/login')
+        login_url = self._urls['/api/auth/login']
         
-        # Attempt multiple failed logins
+        # Attempt multiple failed logins (sequentially, rate limiting is order dependent)
         failed_attempts = 0
         for i in range(10):
             try:
@@ -191,11 +623,13 @@ class PenetrationTester:
                     'password': f'wrongpassword{i}'
                 }
                 
-                response = self.session.post(login_url, json=data, timeout=10)
+                status_code, _ = await self._fetch(
+                    'POST', login_url, data=orjson.dumps(data), headers=JSON_HEADERS
+                )
                 
-                if response.status_code == 401:
+                if status_code == 401:
                     failed_attempts += 1
-                elif response.status_code == 429:
+                elif status_code == 429:
                     self.log_result(
                         'Brute Force Protection',
                         'SECURE',
@@ -208,7 +642,7 @@ class PenetrationTester:
                 self.log_result(
                     'Authentication Test Error',
                     'ERROR',
-                    f'Error during brute force test: {str(e)}',
+                    f'Error during brute force test: {describe_error(e)}',
                     'low'
                 )
                 break
@@ -220,51 +654,42 @@ class PenetrationTester:
                 'medium'
             )
 
-    def test_authorization_bypass(self):
+    async def test_authorization_bypass(self):
         """Test for authorization bypass vulnerabilities"""
-        print("\n=== Testing Authorization Bypass ===")
+        self._log("\n=== Testing Authorization Bypass ===")
         
         # Test accessing admin endpoints without proper authorization
-        admin_endpoints = [
-            '/api/admin/users',
-            '/api/admin/system/health',
-            '/api/admin/analytics',
-            '/api/admin/settings'
-        ]
-        
-        for endpoint in admin_endpoints:
-            try:
-                url = urljoin(self.base_url, endpoint)
-                response = self.session.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    self.log_result(
-                        'Authorization Bypass',
-                        'VULNERABLE',
-                        f'Admin endpoint accessible without authentication: {endpoint}',
-                        'critical'
-                    )
-                elif response.status_code in [401, 403]:
-                    self.log_result(
-                        'Authorization Check',
-                        'SECURE',
-                        f'Admin endpoint properly protected: {endpoint}',
-                        'info'
-                    )
-                    
-            except Exception as e:
+        for endpoint, response in await self._probe_group(ADMIN_ENDPOINTS):
+            if isinstance(response, Exception):
                 self.log_result(
                     'Authorization Test Error',
                     'ERROR',
-                    f'Error testing endpoint {endpoint}: {str(e)}',
+                    f'Error testing endpoint {endpoint}: {describe_error(response)}',
                     'low'
                 )
+                continue
+            
+            status_code = response
+            if status_code == 200:
+                self.log_result(
+                    'Authorization Bypass',
+                    'VULNERABLE',
+                    f'Admin endpoint accessible without authentication: {endpoint}',
+                    'critical'
+                )
+            elif status_code in [401, 403]:
+                self.log_result(
+                    'Authorization Check',
+                    'SECURE',
+                    f'Admin endpoint properly protected: {endpoint}',
+                    'info'
+                )
 
-    def test_input_validation(self):
+    async def test_input_validation(self):
         """Test input validation and sanitization"""
-        print("\n=== Testing Input Validation ===")
+        self._log("\n=== Testing Input Validation ===")
         
-        auth_token = self.authenticate()
+        auth_token = await self.authenticate()
         if not auth_token:
             self.log_result(
                 'Input Validation Testing',
@@ -274,51 +699,49 @@ class PenetrationTester:
             )
             return
         
-        headers = {'Authorization': f'Bearer {auth_token}'}
+        headers = {**JSON_HEADERS, 'Authorization': f'Bearer {auth_token}'}
         
         # Test with oversized inputs
-        large_string = 'A' * 10000
-        
-        endpoints_to_test = [
-            ('/api/tasks', {'title': large_string, 'description': 'test'}),
-            ('/api/projects', {'name': large_string, 'description': 'test'}),
-            ('/api/users/profile', {'firstName': large_string, 'lastName': 'test'})
-        ]
+        responses = await asyncio.gather(
+            *(self._fetch('POST', self._urls[endpoint], data=body, headers=headers)
+              for endpoint, body in self._large_input_bodies),
+            return_exceptions=True
+        )
         
-        for endpoint, data in endpoints_to_test:
-            try:
-                url = urljoin(self.base_url, endpoint)
-                response = self.session.post(url, json=data, headers=headers, timeout=10)
-                
-                if response.status_code == 500:
-                    self.log_result(
-                        'Input Validation - Buffer Overflow',
-                        'VULNERABLE',
-                        f'Server error with large input on {endpoint}',
-                        'medium'
-                    )
-                elif response.status_code == 400:
-                    self.log_result(
-                        'Input Validation',
-                        'SECURE',
-                        f'Proper input validation on {endpoint}',
-                        'info'
-                    )
-                    
-            except Exception as e:
+        for (endpoint, _), response in zip(self._large_input_bodies, responses):
+            if isinstance(response, Exception):
                 self.log_result(
                     'Input Validation Test Error',
                     'ERROR',
-                    f'Error testing {endpoint}: {str(e)}',
+                    f'Error testing {endpoint}: {describe_error(response)}',
                     'low'
                 )
+                continue
+            
+            status_code, _ = response
+            if status_code == 401:
+                self.invalidate_token()
+            elif status_code == 500:
+                self.log_result(
+                    'Input Validation - Buffer Overflow',
+                    'VULNERABLE',
+                    f'Server error with large input on {endpoint}',
+                    'medium'
+                )
+            elif status_code == 400:
+                self.log_result(
+                    'Input Validation',
+                    'SECURE',
+                    f'Proper input validation on {endpoint}',
+                    'info'
+                )
 
-    def test_session_management(self):
+    async def test_session_management(self):
         """Test session management security"""
-        print("\n=== Testing Session Management ===")
+        self._log("\n=== Testing Session Management ===")
         
         # Test JWT token security
-        auth_token = self.authenticate()
+        auth_token = await self.authenticate()
         if not auth_token:
             return
         
@@ -330,13 +753,13 @@ class PenetrationTester:
                 tampered_token = f"{parts[0]}.{parts[1]}."
                 
                 headers = {'Authorization': f'Bearer {tampered_token}'}
-                response = self.session.get(
-                    urljoin(self.base_url, '/api/users/profile'),
-                    headers=headers,
-                    timeout=10
+                status_code, _ = await self._fetch(
+                    'GET',
+                    self._urls['/api/users/profile'],
+                    headers=headers
                 )
                 
-                if response.status_code == 200:
+                if status_code == 200:
                     self.log_result(
                         'JWT Security',
                         'VULNERABLE',
@@ -355,94 +778,60 @@ class PenetrationTester:
             self.log_result(
                 'Session Management Test Error',
                 'ERROR',
-                f'Error testing JWT security: {str(e)}',
+                f'Error testing JWT security: {describe_error(e)}',
                 'low'
             )
 
-    def test_information_disclosure(self):
+    async def test_information_disclosure(self):
         """Test for information disclosure vulnerabilities"""
-        print("\n=== Testing Information Disclosure ===")
+        self._log("\n=== Testing Information Disclosure ===")
         
         # Test for exposed sensitive endpoints
-        sensitive_endpoints = [
-            '/.env',
-            '/config.json',
-            '/package.json',
-            '/api/debug',
-            '/api/health',
-            '/swagger.json',
-            '/api-docs'
-        ]
-        
-        for endpoint in sensitive_endpoints:
-            try:
-                url = urljoin(self.base_url, endpoint)
-                response = self.session.get(url, timeout=10)
-                
-                if response.status_code == 200:
-                    # Check for sensitive information
-                    sensitive_patterns = [
-                        'password',
-                        'secret',
-                        'key',
-                        'token',
-                        'database',
-                        'connection'
-                    ]
-                    
-                    response_text = response.text.lower()
-                    for pattern in sensitive_patterns:
-                        if pattern in response_text:
-                            self.log_result(
-                                'Information Disclosure',
-                                'VULNERABLE',
-                                f'Sensitive information exposed at {endpoint}',
-                                'medium'
-                            )
-                            break
-                    else:
-                        self.log_result(
-                            'Information Disclosure',
-                            'INFO',
-                            f'Endpoint accessible but no sensitive data detected: {endpoint}',
-                            'low'
-                        )
-                        
-            except Exception as e:
+        for endpoint, response in await self._probe_group(SENSITIVE_ENDPOINTS, SENSITIVE_PATTERNS):
+            if isinstance(response, Exception):
                 self.log_result(
                     'Information Disclosure Test Error',
                     'ERROR',
-                    f'Error testing {endpoint}: {str(e)}',
+                    f'Error testing {endpoint}: {describe_error(response)}',
                     'low'
                 )
+                continue
+            
+            # Check for sensitive information
+            status_code, pattern, _ = response
+            if status_code == 200:
+                if pattern:
+                    self.log_result(
+                        'Information Disclosure',
+                        'VULNERABLE',
+                        f'Sensitive information exposed at {endpoint}',
+                        'medium'
+                    )
+                else:
+                    self.log_result(
+                        'Information Disclosure',
+                        'INFO',
+                        f'Endpoint accessible but no sensitive data detected: {endpoint}',
+                        'low'
+                    )
 
-    def test_security_headers(self):
+    async def test_security_headers(self):
         """Test for security headers"""
-        print("\n=== Testing Security Headers ===")
+        self._log("\n=== Testing Security Headers ===")
         
         try:
-            response = self.session.get(self.base_url, timeout=10)
-            headers = response.headers
-            
-            # Check for important security headers
-            security_headers = {
-                'X-Content-Type-Options': 'nosniff',
-                'X-Frame-Options': ['DENY', 'SAMEORIGIN'],
-                'X-XSS-Protection': '1; mode=block',
-                'Strict-Transport-Security': None,
-                'Content-Security-Policy': None,
-                'Referrer-Policy': None
-            }
+            # Cached under its own method tag, apart from body scans of the same URL
+            _, headers = await self._cached(
+                'HEADERS', self.base_url, None, functools.partial(self._fetch_headers, self.base_url)
+            )
             
-            missing_headers = []
-            for header, expected_value in security_headers.items():
-                if header not in headers:
-                    missing_headers.append(header)
-                elif expected_value and isinstance(expected_value, list):
-                    if headers[header] not in expected_value:
-                        missing_headers.append(f"{header} (incorrect value)")
-                elif expected_value and headers[header] != expected_value:
-                    missing_headers.append(f"{header} (incorrect value)")
+            # Check for important security headers (header lookups are case-insensitive)
+            missing_headers = [header for header in REQUIRED_SECURITY_HEADERS if header not in headers]
+            missing_headers += [
+                f"{header} (incorrect value)"
+                for header, allowed in EXPECTED_HEADER_VALUES.items()
+                if header in headers and headers[header] not in allowed
+            ]
             
             if missing_headers:
                 self.log_result(
@@ -463,110 +852,87 @@ class PenetrationTester:
             self.log_result(
                 'Security Headers Test Error',
                 'ERROR',
-                f'Error testing security headers: {str(e)}',
+                f'Error testing security headers: {describe_error(e)}',
                 'low'
             )
 
-    def authenticate(self):
-        """Attempt to authenticate and return token"""
+    def invalidate_token(self):
+        """Forget the cached token so the next authenticate() logs in again"""
+        self._token = None
+
+    async def authenticate(self):
+        """Attempt to authenticate and return token, reusing it while it is fresh"""
+        # Tests running concurrently wait on a single in-flight login
+        async with self._auth_lock:
+            if self._token and time.monotonic() - self._token_time < AUTH_TOKEN_TTL:
+                return self._token
+            return await self._login()
+
+    async def _login(self):
+        """Log in with the test account and cache the returned token"""
         try:
-            login_url = urljoin(self.base_url, '/api/auth/login')
+            login_url = self._urls['/api/auth/login']
             data = {
                 'email': 'test@example.com',
                 'password': 'testpassword123'
             }
             
-            response = self.session.post(login_url, json=data, timeout=10)
+            status_code, body = await self._fetch(
+                'POST', login_url, data=orjson.dumps(data), headers=JSON_HEADERS
+            )
             
-            if response.status_code == 200:
-                result = response.json()
-                return result.get('token') or result.get('accessToken')
+            if status_code == 200:
+                result = orjson.loads(body)
+                self._token = result.get('token') or result.get('accessToken')
+                self._token_time = time.monotonic()
+                return self._token
             
         except Exception as e:
             self.log_result(
                 'Authentication Error',
                 'ERROR',
-                f'Could not authenticate: {str(e)}',
+                f'Could not authenticate: {describe_error(e)}',
                 'low'
             )
         
         return None
 
     def generate_report(self):
-        """Generate HTML report of test results"""
-        html_template = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Penetration Testing Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .header { background-color: #f4f4f4; padding: 20px; border-radius: 5px; }
-                .summary { margin: 20px 0; }
-                .result { margin: 10px 0; padding: 10px; border-radius: 5px; }
-                .critical { background-color: #ffebee; border-left: 5px solid #f44336; }
-                .high { background-color: #fff3e0; border-left: 5px solid #ff9800; }
-                .medium { background-color: #f3e5f5; border-left: 5px solid #9c27b0; }
-                .low { background-color: #e8f5e8; border-left: 5px solid #4caf50; }
-                .info { background-color: #e3f2fd; border-left: 5px solid #2196f3; }
-                .vulnerable { background-color: #ffcdd2; }
-                .secure { background-color: #c8e6c9; }
-                .error { background-color: #ffecb3; }
-                .timestamp { font-size: 0.8em; color: #666; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>Penetration Testing Report</h1>
-                <p><strong>Target:</strong> {target}</p>
-                <p><strong>Generated:</strong> {timestamp}</p>
-            </div>
-            
-            <div class="summary">
-                <h2>Summary</h2>
-                <p><strong>Total Tests:</strong> {total_tests}</p>
-                <p><strong>Critical Issues:</strong> {critical_count}</p>
-                <p><strong>High Issues:</strong> {high_count}</p>
-                <p><strong>Medium Issues:</strong> {medium_count}</p>
-                <p><strong>Low Issues:</strong> {low_count}</p>
-            </div>
-            
-            <div class="results">
-                <h2>Detailed Results</h2>
-                {results_html}
-            </div>
-        </body>
-        </html>
-        """
+        """Generate HTML report of test results
         
-        # Count results by severity
-        severity_counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-        for result in self.results:
-            severity = result.get('severity', 'low')
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+        Returns the (critical, high) lists of vulnerable results for the summary.
+        """
         
-        # Generate results HTML
-        results_html = ""
+        # Count results by severity, collect vulnerable critical/high issues and
+        # generate results HTML (escaped, as details may echo attack payloads) in one pass
+        severity_counts = Counter()
+        issues = {'critical': [], 'high': []}
+        parts = []
         for result in self.results:
             severity = result.get('severity', 'low')
             status = result.get('status', 'unknown').lower()
             
-            css_class = f"{severity} {status}"
+            severity_counts[severity] += 1
+            if status == 'vulnerable' and severity in issues:
+                issues[severity].append(result)
             
-            results_html += f"""
+            css_class = (self.RESULT_CSS_CLASSES.get((severity, status))
+                         or html.escape(f"{severity} {status}"))
+            
+            parts.append(f"""
             <div class="result {css_class}">
-                <h3>{result['test_name']}</h3>
-                <p><strong>Status:</strong> {result['status']}</p>
-                <p><strong>Severity:</strong> {result['severity'].upper()}</p>
-                <p><strong>Details:</strong> {result['details']}</p>
+                <h3>{html.escape(result['test_name'])}</h3>
+                <p><strong>Status:</strong> {html.escape(result['status'])}</p>
+                <p><strong>Severity:</strong> {html.escape(result['severity'].upper())}</p>
+                <p><strong>Details:</strong> {html.escape(result['details'])}</p>
                 <p class="timestamp">{result['timestamp']}</p>
             </div>
-            """
+            """)
+        results_html = "".join(parts)
         
         # Generate final HTML
-        html_content = html_template.format(
-            target=self.base_url,
+        html_content = HTML_REPORT_TEMPLATE.substitute(
+            target=html.escape(self.base_url),
             timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
             total_tests=len(self.results),
             critical_count=severity_counts['critical'],
@@ -581,46 +947,92 @@ class PenetrationTester:
             f.write(html_content)
         
         print(f"\nReport generated: {self.output_file}")
+        
+        return issues['critical'], issues['high']
+
+    async def _run_tests(self):
+        """Run all test methods on a single shared HTTP session
+        
+        Results are appended from a single event loop thread, so concurrent
+        tests need no extra locking around self.results.
+        """
+        # Keep pooled connections alive across tests so TCP/TLS setup is paid once,
+        # and resolve the target host once per run. aiohttp already sets
+        # TCP_NODELAY on its client sockets, so small JSON bodies go out immediately.
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTION_POOL_SIZE,
+            limit_per_host=CONNECTION_POOL_SIZE,
+            keepalive_timeout=60,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            ssl=False
+        )
+        timeout = aiohttp.ClientTimeout(total=10)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as self.session:
+            # Independent tests touch different endpoints and run concurrently
+            test_methods = [
+                self.test_sql_injection,
+                self.test_xss_vulnerabilities,
+                self.test_authorization_bypass,
+                self.test_input_validation,
+                self.test_session_management,
+                self.test_information_disclosure,
+                self.test_security_headers
+            ]
+            
+            await asyncio.gather(*(self._run_test(test_method) for test_method in test_methods))
+            
+            # The brute force test provokes rate limiting, so it runs last on its own
+            await self._run_test(self.test_authentication_security)
+
+    async def _run_test(self, test_method):
+        """Run one test method, flushing its buffered output once it finishes"""
+        buffer = []
+        token = _log_buffer.set(buffer)
+        try:
+            await test_method()
+        except Exception as e:
+            self.log_result(
+                f'Test Error - {test_method.__name__}',
+                'ERROR',
+                f'Unexpected error: {describe_error(e)}',
+                'low'
+            )
+        finally:
+            _log_buffer.reset(token)
+            sys.stderr.write(''.join(buffer))
+            sys.stderr.flush()
 
     def run_all_tests(self):
         """Run all penetration tests"""
         print(f"Starting penetration testing against: {self.base_url}")
+        if self.cache is not None:
+            print(f"Reusing probe results cached in the last {RESPONSE_CACHE_TTL}s "
+                  f"from {RESPONSE_CACHE_DIR} (use --no-cache to re-probe everything)")
         print("=" * 60)
         
-        # Run all test methods
-        test_methods = [
-            self.test_sql_injection,
-            self.test_xss_vulnerabilities,
-            self.test_authentication_security,
-            self.test_authorization_bypass,
-            self.test_input_validation,
-            self.test_session_management,
-            self.test_information_disclosure,
-            self.test_security_headers
-        ]
+        # Run all test methods, on the faster uvloop event loop when it is installed
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        try:
+            with asyncio.Runner(loop_factory=loop_factory) as runner:
+                runner.run(self._run_tests())
+        finally:
+            if self.cache is not None:
+                self.cache.close()
         
-        for test_method in test_methods:
-            try:
-                test_method()
-            except Exception as e:
-                self.log_result(
-                    f'Test Error - {test_method.__name__}',
-                    'ERROR',
-                    f'Unexpected error: {str(e)}',
-                    'low'
-                )
+        if self.cache_hits:
+            print(f"\n{self.cache_hits} probe results were served from the cache; "
+                  f"re-run with --no-cache to verify fixes against the live target")
         
         # Generate report
-        self.generate_report()
+        critical_issues, high_issues = self.generate_report()
         
         # Print summary
         print("\n" + "=" * 60)
         print("PENETRATION TESTING COMPLETE")
         print("=" * 60)
         
-        critical_issues = [r for r in self.results if r.get('severity') == 'critical' and r.get('status') == 'VULNERABLE']
-        high_issues = [r for r in self.results if r.get('severity') == 'high' and r.get('status') == 'VULNERABLE']
-        
         if critical_issues:
             print(f"🚨 CRITICAL: {len(critical_issues)} critical security issues found!")
             for issue in critical_issues:
@@ -640,11 +1052,13 @@ def main():
     parser = argparse.ArgumentParser(description='Automated Penetration Testing Tool')
     parser.add_argument('--target', '-t', required=True, help='Target URL (e.g., http://localhost:3000)')
     parser.add_argument('--output', '-o', default='penetration-test-report.html', help='Output report file')
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f'Do not reuse responses cached by recent runs in {RESPONSE_CACHE_DIR}')
     
     args = parser.parse_args()
     
     # Create tester instance and run tests
-    tester = PenetrationTester(args.target, args.output)
+    tester = PenetrationTester(args.target, args.output, use_cache=not args.no_cache)
     tester.run_all_tests()
 
 if __name__ == '__main__':